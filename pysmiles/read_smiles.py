@@ -31,6 +31,8 @@ from .write_smiles import write_smiles_component
 
 LOGGER = logging.getLogger(__name__)
 
+ORGANIC_SUBSET = frozenset('B C N O P S F Cl Br I * b c n o s p'.split())
+
 
 @enum.unique
 class TokenType(enum.Enum):
@@ -50,7 +52,7 @@ def _tokenize(smiles):
 
     Parameters
     ----------
-    smiles : iterable
+    smiles : str
         The SMILES string to iterate over
 
     Yields
@@ -58,43 +60,43 @@ def _tokenize(smiles):
     tuple(TokenType, str)
         A tuple describing the type of token and the associated data
     """
-    organic_subset = 'B C N O P S F Cl Br I * b c n o s p'.split()
-    smiles = iter(smiles)
-    token = ''
-    peek = None
-    while True:
-        char = peek if peek else next(smiles, '')
-        peek = None
-        if not char:
-            break
+    organic_subset = ORGANIC_SUBSET
+    idx = 0
+    length = len(smiles)
+    while idx < length:
+        char = smiles[idx]
         if char == '[':
-            token = char
-            for char in smiles:  # pragma: no branch
-                token += char
-                if char == ']':
-                    break
-            yield TokenType.ATOM, token
+            end = smiles.find(']', idx)
+            if end == -1:
+                # There is no closing bracket; yield what's left as the token
+                # and let parse_atom reject it.
+                yield TokenType.ATOM, smiles[idx:]
+                break
+            yield TokenType.ATOM, smiles[idx:end + 1]
+            idx = end + 1
+        elif smiles[idx:idx + 2] in organic_subset:
+            yield TokenType.ATOM, smiles[idx:idx + 2]
+            idx += 2
         elif char in organic_subset:
-            peek = next(smiles, '')
-            if char + peek in organic_subset:
-                yield TokenType.ATOM, char + peek
-                peek = None
-            else:
-                yield TokenType.ATOM, char
-        elif char in '-=#$:.':
-            yield TokenType.BOND_TYPE, char
-        elif char == '(':
-            yield TokenType.BRANCH_START, '('
-        elif char == ')':
-            yield TokenType.BRANCH_END, ')'
+            yield TokenType.ATOM, char
+            idx += 1
         elif char == '%':
             # If smiles is too short this will raise a ValueError, which is
-            # (slightly) prettier than a StopIteration.
-            yield TokenType.RING_NUM, int(next(smiles, '') + next(smiles, ''))
-        elif char in '/\\':
-            yield TokenType.EZSTEREO, char
-        elif char.isdigit():  # pragma: no branch
-            yield TokenType.RING_NUM, int(char)
+            # (slightly) prettier than an IndexError.
+            yield TokenType.RING_NUM, int(smiles[idx + 1:idx + 3])
+            idx += 3
+        else:
+            if char in '-=#$:.':
+                yield TokenType.BOND_TYPE, char
+            elif char == '(':
+                yield TokenType.BRANCH_START, '('
+            elif char == ')':
+                yield TokenType.BRANCH_END, ')'
+            elif char in '/\\':
+                yield TokenType.EZSTEREO, char
+            elif char.isdigit():  # pragma: no branch
+                yield TokenType.RING_NUM, int(char)
+            idx += 1
 
 
 def read_smiles(smiles, explicit_hydrogen=False, zero_order_bonds=True, 
@@ -225,7 +227,10 @@ def read_smiles(smiles, explicit_hydrogen=False, zero_order_bonds=True,
     # This is a bit of an overreach, we should only add implicit hydrogens to
     # atoms in the organic subset. However, all non-organic atoms already have
     # a hcount, so all is well.
-    fill_valence(mol)
+    # No bond orders change between filling the valences and validating them
+    # below, so the bond totals can be shared.
+    bond_cache = {}
+    fill_valence(mol, _cache=bond_cache)
 
     for node in mol:
         element = mol.nodes[node].get('element', '*')
@@ -235,7 +240,7 @@ def read_smiles(smiles, explicit_hydrogen=False, zero_order_bonds=True,
                 raise KeyError(msg)
             else:
                 LOGGER.warning(msg)
-        elif element != '*' and bonds_missing(mol, node):
+        elif element != '*' and bonds_missing(mol, node, _cache=bond_cache):
             debug_smiles = write_smiles_component(nx.ego_graph(mol, node))
             msg = (f'Node {node} ({format_atom(mol, node)}) has non-standard'
                    f' valence: ...{debug_smiles}...')
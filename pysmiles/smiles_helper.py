@@ -20,25 +20,27 @@ some convenience functions for adding hydrogens, and detecting aromaticity.
 
 import logging
 import re
-import operator
+import sys
 from itertools import product
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import networkx as nx
 from . import PTE
 
 LOGGER = logging.getLogger(__name__)
 
-ISOTOPE_PATTERN = r'(?P<isotope>[\d]+)?'
+# SMILES is pure ASCII, so compile with re.ASCII and spell digits as [0-9]:
+# this keeps the character classes free of Unicode property lookups.
+ISOTOPE_PATTERN = r'(?P<isotope>[0-9]+)?'
 ELEMENT_PATTERN = r'(?P<element>b|c|n|o|s|p|as|se|\*|[A-Z][a-z]{0,2})'
-STEREO_PATTERN = r'(?P<rs_isomer>@|@@|@TH[1-2]|@AL[1-2]|@SP[1-3]|@OH[\d]{1,2}|'\
-                  r'@TB[\d]{1,2})?'
-HCOUNT_PATTERN = r'(?P<hcount>H[\d]?)?'
-CHARGE_PATTERN = r'(?P<charge>(-|\+)(\++|-+|[\d]{1,2})?)?'
-CLASS_PATTERN = r'(?::(?P<class>[\d]+))?'
+STEREO_PATTERN = r'(?P<rs_isomer>@|@@|@TH[1-2]|@AL[1-2]|@SP[1-3]|@OH[0-9]{1,2}|'\
+                  r'@TB[0-9]{1,2})?'
+HCOUNT_PATTERN = r'(?P<hcount>H[0-9]?)?'
+CHARGE_PATTERN = r'(?P<charge>(-|\+)(\++|-+|[0-9]{1,2})?)?'
+CLASS_PATTERN = r'(?::(?P<class>[0-9]+))?'
 ATOM_PATTERN = re.compile(r'^\[' + ISOTOPE_PATTERN + ELEMENT_PATTERN +
                           STEREO_PATTERN + HCOUNT_PATTERN + CHARGE_PATTERN +
-                          CLASS_PATTERN + r'\]$')
+                          CLASS_PATTERN + r'\]$', flags=re.ASCII)
 
 # Used to parse the electron config we get from the PTE. These configs look like
 # [Rn]7s27p65f146d10(predicted) (for Og). We don't care about the core electrons
@@ -51,9 +53,145 @@ ATOM_PATTERN = re.compile(r'^\[' + ISOTOPE_PATTERN + ELEMENT_PATTERN +
 ELECTRON_CONFIG_PATTERN = (r'(?:\[[A-Z][a-z]?\])?((?:'
                            r'(?:[1-9]s(?P<s>[1-2]))|(?:[1-9]p(?P<p>[1-6]))|(?:[1-9]d(?P<d>10|[1-9]))|(?:[1-9]f(?P<f>1[0-4]|[1-9]))'
                            r'){1,4})(?:\(predicted\))?')
-ELECTRON_CONFIG_PATTERN = re.compile(ELECTRON_CONFIG_PATTERN)
+ELECTRON_CONFIG_PATTERN = re.compile(ELECTRON_CONFIG_PATTERN, flags=re.ASCII)
 
-AROMATIC_ATOMS = "B C N O P S Se As *".split()
+AROMATIC_ATOMS = frozenset("B C N O P S Se As *".split())
+
+# The elements that can be written without brackets: the aromatic organic
+# subset (lowercase, plus the wildcard), and the halogens.
+_ORGANIC_SUBSET_LOWER = frozenset('bcnops*')
+_HALOGENS = frozenset(('F', 'Cl', 'Br', 'I'))
+
+# What parse_atom('[H]') produces, minus the hcount: the attributes for the
+# hydrogen atoms added by add_explicit_hydrogens.
+_H_ATOM_ATTRS = {'element': 'H', 'charge': 0, 'aromatic': False}
+
+_DIGITS = frozenset('0123456789')
+_AROMATIC_ORGANIC = frozenset('bcnosp')
+_AROMATIC_TWO_LETTER = frozenset(('as', 'se'))
+_STEREO_CODES = frozenset(('TH', 'AL', 'SP', 'OH', 'TB'))
+
+
+def _scan_bracket_atom(atom):
+    """
+    Single-pass scanner for bracketed atom tokens such as "[13CH3-1:2]".
+    Accepts exactly the language described by ``ATOM_PATTERN``, but walks the
+    string once instead of going through the regex engine, and produces the
+    final values directly.
+
+    Parameters
+    ----------
+    atom : str
+        The bracketed atom token, including the enclosing square brackets.
+
+    Returns
+    -------
+    dict or None
+        A dictionary with the keys 'charge', 'hcount' and 'aromatic', and,
+        where present in the token, 'isotope', 'element', 'rs_isomer' and
+        'class'. Returns None if the token is malformed.
+    """
+    inner = atom[1:-1]
+    length = len(inner)
+    idx = 0
+    out = {'charge': 0, 'hcount': 0, 'aromatic': False}
+    # Isotope: a run of digits before the element.
+    start = idx
+    while idx < length and inner[idx] in _DIGITS:
+        idx += 1
+    if idx > start:
+        out['isotope'] = int(inner[start:idx])
+    if idx >= length:
+        return None
+    # Element: aromatic (lowercase) subset, wildcard, or a capitalized symbol.
+    char = inner[idx]
+    if inner[idx:idx + 2] in _AROMATIC_TWO_LETTER:
+        element = inner[idx:idx + 2]
+        out['aromatic'] = True
+        idx += 2
+    elif char in _AROMATIC_ORGANIC:
+        element = char
+        out['aromatic'] = True
+        idx += 1
+    elif char == '*':
+        element = '*'
+        idx += 1
+    elif 'A' <= char <= 'Z':
+        start = idx
+        idx += 1
+        while idx < length and idx - start < 3 and 'a' <= inner[idx] <= 'z':
+            idx += 1
+        element = inner[start:idx]
+    else:
+        return None
+    if element != '*':
+        # Intern the symbol: every atom sharing an element then points at the
+        # same string object, making downstream comparisons and dict lookups
+        # pointer checks.
+        out['element'] = sys.intern(element.capitalize())
+    # Stereochemistry: @, @@, or @ followed by a shape code and index.
+    if idx < length and inner[idx] == '@':
+        idx += 1
+        if idx < length and inner[idx] == '@':
+            out['rs_isomer'] = '@@'
+            idx += 1
+        else:
+            out['rs_isomer'] = '@'
+            code = inner[idx:idx + 2]
+            if code in _STEREO_CODES:
+                start = idx + 2
+                jdx = start
+                while jdx < length and jdx - start < 2 and inner[jdx] in _DIGITS:
+                    jdx += 1
+                number = inner[start:jdx]
+                if code in ('OH', 'TB'):
+                    valid = bool(number)
+                else:
+                    valid = number in ('1', '2') or (code == 'SP' and number == '3')
+                if valid:
+                    out['rs_isomer'] = '@' + code + number
+                    idx = jdx
+    # Hydrogen count: H with an optional single digit.
+    if idx < length and inner[idx] == 'H':
+        idx += 1
+        if idx < length and inner[idx] in _DIGITS:
+            out['hcount'] = int(inner[idx])
+            idx += 1
+        else:
+            out['hcount'] = 1
+    # Charge: a sign followed by more signs or by one or two digits.
+    if idx < length and inner[idx] in '+-':
+        sign_char = inner[idx]
+        sign = 1 if sign_char == '+' else -1
+        idx += 1
+        if idx < length and inner[idx] in _DIGITS:
+            start = idx
+            while idx < length and idx - start < 2 and inner[idx] in _DIGITS:
+                idx += 1
+            out['charge'] = sign * int(inner[start:idx])
+        elif idx < length and inner[idx] in '+-':
+            run_char = inner[idx]
+            run = 0
+            while idx < length and inner[idx] == run_char:
+                run += 1
+                idx += 1
+            # Mirrors parse_charge: the charge is the number of times the
+            # leading sign occurs in the full charge token.
+            out['charge'] = sign * (1 + run if run_char == sign_char else 1)
+        else:
+            out['charge'] = sign
+    # Class: a colon followed by digits.
+    if idx < length and inner[idx] == ':':
+        idx += 1
+        start = idx
+        while idx < length and inner[idx] in _DIGITS:
+            idx += 1
+        if idx == start:
+            return None
+        out['class'] = int(inner[start:idx])
+    if idx != length:
+        return None
+    return out
 
 
 def parse_atom(atom):
@@ -77,34 +215,41 @@ def parse_atom(atom):
         if atom != '*':
             # Don't specify hcount to signal we don't actually know anything
             # about it
-            return {'element': atom.capitalize(), 'charge': 0,
+            return {'element': sys.intern(atom.capitalize()), 'charge': 0,
                     'aromatic': atom.islower()}
         else:
             return defaults.copy()
-    match = ATOM_PATTERN.match(atom)
-    if match is None:
-        raise ValueError('The atom {} is malformatted'.format(atom))
-    out = defaults.copy()
-    out.update({k: v for k, v in match.groupdict().items() if v is not None})
-
-    if out.get('element', 'X').islower():
-        out['aromatic'] = True
-
-    parse_helpers = {
-        'isotope': int,
-        'element': str.capitalize,
-        'rs_isomer': lambda x: x,
-        'hcount': parse_hcount,
-        'charge': parse_charge,
-        'class': int,
-        'aromatic': lambda x: x,
-    }
-
-    for attr, val_str in out.items():
-        out[attr] = parse_helpers[attr](val_str)
-
-    if out['element'] == '*':
-        del out['element']
+    if atom.startswith('[') and atom.endswith(']') and len(atom) > 2:
+        out = _scan_bracket_atom(atom)
+    else:
+        out = None
+    if out is None:
+        # The scanner accepts exactly the tokens ATOM_PATTERN does, so keep
+        # the pattern around to validate (and reject) anything it refused.
+        match = ATOM_PATTERN.match(atom)
+        if match is None:
+            raise ValueError('The atom {} is malformatted'.format(atom))
+        out = defaults.copy()
+        out.update({k: v for k, v in match.groupdict().items() if v is not None})
+
+        if out.get('element', 'X').islower():
+            out['aromatic'] = True
+
+        parse_helpers = {
+            'isotope': int,
+            'element': lambda s: sys.intern(s.capitalize()),
+            'rs_isomer': lambda x: x,
+            'hcount': parse_hcount,
+            'charge': parse_charge,
+            'class': int,
+            'aromatic': lambda x: x,
+        }
+
+        for attr, val_str in out.items():
+            out[attr] = parse_helpers[attr](val_str)
+
+        if out['element'] == '*':
+            del out['element']
 
     if out.get('element') == 'H' and out.get('hcount', 0):
         raise ValueError("A hydrogen atom can't have hydrogens")
@@ -142,7 +287,6 @@ def format_atom(molecule, node_key, default_element='*'):
     isotope = node.get('isotope', '')
     class_ = node.get('class', '')
     aromatic = node.get('aromatic', False)
-    default_h = has_default_h_count(molecule, node_key)
 
     if stereo is not None or node.get('ez_isomer'):  # pragma: nocover
         LOGGER.warning("The SMILES writer does not write stereochemical information")
@@ -150,8 +294,12 @@ def format_atom(molecule, node_key, default_element='*'):
     if aromatic and name in AROMATIC_ATOMS:
         name = name.lower()
 
-    if (stereo is None and isotope == '' and charge == 0 and default_h and class_ == '' and
-            (name.lower() in 'b c n o p s *'.split() or name in 'F Cl Br I'.split())):
+    # Check the cheap attributes first: has_default_h_count walks the atom's
+    # bonds and computes its valence, and only matters once everything else
+    # allows the bracket-free notation.
+    if (stereo is None and isotope == '' and charge == 0 and class_ == '' and
+            (name.lower() in _ORGANIC_SUBSET_LOWER or name in _HALOGENS) and
+            has_default_h_count(molecule, node_key)):
         return name
 
     if hcount:
@@ -241,15 +389,15 @@ def add_explicit_hydrogens(mol):
     None
         `mol` is modified in-place.
     """
-    h_atom = parse_atom('[H]')
-    if 'hcount' in h_atom:  # pragma: nocover; defensive
-        del h_atom['hcount']
+    next_id = max(mol) + 1 if mol else 0
     for n_idx in list(mol.nodes):
         hcount = mol.nodes[n_idx].get('hcount', 0)
-        idxs = range(max(mol) + 1, max(mol) + hcount + 1)
-        # Get the defaults from parse_atom.
-        mol.add_nodes_from(idxs, **h_atom.copy())
-        mol.add_edges_from([(n_idx, jdx) for jdx in idxs], order=1)
+        idxs = range(next_id, next_id + hcount)
+        next_id += hcount
+        # add_nodes_from copies the attributes for every node, so the
+        # module-level template can be shared.
+        mol.add_nodes_from(idxs, **_H_ATOM_ATTRS)
+        mol.add_edges_from(((n_idx, jdx) for jdx in idxs), order=1)
         if 'hcount' in mol.nodes[n_idx]:
             del mol.nodes[n_idx]['hcount']
         if 'rs_isomer' in mol.nodes[n_idx]:
@@ -277,20 +425,20 @@ def remove_explicit_hydrogens(mol):
     """
     to_remove = set()
 #    defaults = parse_atom('[H]')
-    for n_idx in mol.nodes:
-        node = mol.nodes[n_idx]
-        neighbors = list(mol[n_idx])
+    for n_idx, node in mol.nodes(data=True):
         # TODO: get these defaults from parsing [H]. But do something smart
         #       with the hcount attribute.
-        if (node.get('charge', 0) == 0 and node.get('element', '') == 'H' and
+        # Check the node attributes before looking at the neighbours, so that
+        # for most atoms we never need to touch the adjacencies at all.
+        if (node.get('element', '') == 'H' and node.get('charge', 0) == 0 and
                 'isotope' not in node and node.get('class', 0) == 0 and
-                len(neighbors) == 1):
-            neighbor = neighbors[0]
+                mol.degree(n_idx) == 1):
+            neighbor = next(iter(mol[n_idx]))
             if (mol.nodes[neighbor].get('element', '') == 'H' or
                     mol.edges[n_idx, neighbor].get('order', 1) != 1):
                 # The molecule is H2, or the bond order is not 1.
                 continue
-            if mol.nodes[n_idx].get('ez_isomer'):
+            if node.get('ez_isomer'):
                 anchor = mol.nodes[n_idx]['ez_isomer'][1]
                 for ez_neighbor in mol[anchor]:
                     if (ez_neighbor != n_idx
@@ -316,13 +464,12 @@ def remove_explicit_hydrogens(mol):
                 # Replace the explicit hydrogen index for the implicit one
                 mol.nodes[neighbor]['rs_isomer'] = tuple(n if n != n_idx else neighbor for n in mol.nodes[neighbor]['rs_isomer'])
     mol.remove_nodes_from(to_remove)
-    for n_idx in mol.nodes:
-        if 'hcount' not in mol.nodes[n_idx]:
-            mol.nodes[n_idx]['hcount'] = 0
+    nx.set_node_attributes(mol, {n_idx: 0 for n_idx, node in mol.nodes(data=True)
+                                 if 'hcount' not in node}, 'hcount')
 
 
 def fill_valence(mol, respect_hcount=True, respect_bond_order=True,
-                 max_bond_order=3):
+                 max_bond_order=3, _cache=None):
     """
     Sets the attribute 'hcount' on all nodes in `mol` that don't have it yet.
     The value to which it is set is based on the node's 'element', and the
@@ -343,23 +490,34 @@ def fill_valence(mol, respect_hcount=True, respect_bond_order=True,
     max_bond_order : number
         Only meaningful if respect_bond_order is False. This is the highest
         bond order that will be set.
+    _cache : dict, optional
+        A cache of bond totals per node, shared between calls that don't
+        change any bond orders in between.
 
     Returns
     -------
     None
         `mol` is modified in-place.
     """
+    residual = None
     if not respect_bond_order:
-        increment_bond_orders(mol, max_bond_order=max_bond_order)
-    for n_idx in mol:
-        node = mol.nodes[n_idx]
+        # increment_bond_orders already knows how far every atom is still
+        # under valence afterwards, so reuse that instead of recomputing.
+        residual = increment_bond_orders(mol, max_bond_order=max_bond_order)
+        if _cache:
+            # The bond orders just changed, so any cached totals are stale.
+            _cache.clear()
+    for n_idx, node in mol.nodes(data=True):
         if ('hcount' in node and respect_hcount) or node.get('element') == 'H':
             continue
-        missing = max(bonds_missing(mol, n_idx), 0)
+        if residual is not None:
+            missing = max(residual[n_idx], 0)
+        else:
+            missing = max(_missing_bonds(node, _bonds(mol, n_idx, _cache=_cache)), 0)
         node['hcount'] = node.get('hcount', 0) + missing
 
 
-def bonds_missing(mol, node_idx, use_order=True):
+def bonds_missing(mol, node_idx, use_order=True, _cache=None):
     """
     Returns how much the specified node is under valence. If use_order is
     False, treat all bonds as if they are order 1.
@@ -372,22 +530,57 @@ def bonds_missing(mol, node_idx, use_order=True):
         The node to look at. Should be in mol.
     use_order : bool
         If False, treat all bonds as single.
+    _cache : dict, optional
+        A cache of bond totals per node, see :func:`_bonds`.
 
     Returns
     -------
     int
         The number of missing bonds.
     """
-    bonds = _bonds(mol, node_idx, use_order)
-    bonds += mol.nodes[node_idx].get('hcount', 0)
+    return _missing_bonds(mol.nodes[node_idx],
+                          _bonds(mol, node_idx, use_order, _cache=_cache))
+
+
+def _missing_bonds(node, bonds):
+    """
+    Returns how much an atom is under valence, given its attribute dict and
+    the total order of its explicit bonds. Allows callers that already hold
+    the attribute dict to skip the node lookups in :func:`bonds_missing`.
 
-    val = valence(mol.nodes[node_idx])
+    Parameters
+    ----------
+    node : dict
+        The atom's attributes.
+    bonds : number
+        The total order of the explicit bonds the atom has.
+
+    Returns
+    -------
+    int
+        The number of missing bonds.
+    """
+    bonds += node.get('hcount', 0)
+    val = valence(node)
     if not val:
         return 0
     val = [v for v in val if v >= bonds] or val[-1:]
     return int(val[0] - bonds)
 
 
+# Direct symbol to atomic number lookup, including the lowercase aromatic
+# spellings, so the hot path needs neither str.capitalize nor the full PTE
+# element record.
+_ATOMIC_NUMBERS = {symbol: entry['AtomicNumber']
+                   for symbol, entry in PTE.items() if isinstance(symbol, str)}
+_ATOMIC_NUMBERS.update({symbol.lower(): number
+                        for symbol, number in list(_ATOMIC_NUMBERS.items())})
+
+# Valences only depend on the element and the charge, and there are very few
+# distinct combinations in practice, so computed values are memoized here.
+_VALENCE_CACHE = {}
+
+
 def valence(atom):
     """
     Returns the valence of the atom. Since some elements can have
@@ -405,16 +598,47 @@ def valence(atom):
     element = atom.get("element", '*')
     if element == '*':
         return []
+    charge = atom.get('charge', 0)
+    try:
+        # parse_atom stores elements capitalized, so this almost always hits
+        # without having to spell out str.capitalize first.
+        return list(_VALENCE_CACHE[element, charge])
+    except KeyError:
+        pass
+    capitalized = element.capitalize()
+    val = tuple(_compute_valence(capitalized, charge))
+    _VALENCE_CACHE[capitalized, charge] = val
+    _VALENCE_CACHE[element, charge] = val
+    return list(val)
+
+
+def _compute_valence(element, charge):
+    """
+    Computes the possible valences for an element carrying the given charge,
+    based on the electron configuration from the PTE. See :func:`valence`.
 
-    electrons = PTE[element.capitalize()]['AtomicNumber']
-    electrons -= atom.get('charge', 0)
+    Parameters
+    ----------
+    element : str
+        A capitalized element symbol. Should be in the PTE.
+    charge : int
+        The formal charge on the atom.
+
+    Returns
+    -------
+    list[int]
+        The valences. Empty if we don't know.
+    """
+    electrons = _ATOMIC_NUMBERS[element]
+    electrons -= charge
     if not electrons:
         return [0]
     try:
         pte_data = PTE[electrons]
     except KeyError as error:
-        raise ValueError(f"Can't figure out an electron configuration for {atom}"
-                         f" with {electrons} electrons") from error
+        raise ValueError(f"Can't figure out an electron configuration for "
+                         f"{element} with charge {charge} and {electrons} "
+                         f"electrons") from error
     electron_config = pte_data['ElectronConfiguration']
     match = ELECTRON_CONFIG_PATTERN.match(electron_config)
     electron_config = {k: int(v) for k, v in match.groupdict(default=0).items()}
@@ -454,7 +678,7 @@ def valence(atom):
     return val
 
 
-def _bonds(mol, node_idx, use_order=True):
+def _bonds(mol, node_idx, use_order=True, _cache=None):
     """
     Returns how many explicit bonds the specified node has. If use_order is
     False, treat all bonds as if they are order 1.
@@ -467,22 +691,30 @@ def _bonds(mol, node_idx, use_order=True):
         The node to look at. Should be in mol.
     use_order : bool
         If False, treat all bonds as single.
+    _cache : dict, optional
+        A cache of bond totals keyed by (node_idx, use_order). Only valid as
+        long as no bond orders change; the caller is responsible for not
+        reusing a stale cache.
 
     Returns
     -------
     int
         The number of bonds.
     """
+    if _cache is not None and (node_idx, use_order) in _cache:
+        return _cache[node_idx, use_order]
+    # Go through the adjacency dict directly: building an EdgeDataView per
+    # call is far more expensive than summing the neighbouring edge dicts.
     if use_order:
-        bond_orders = map(operator.itemgetter(2),
-                          mol.edges(nbunch=node_idx, data='order', default=1))
-        bonds = sum(bond_orders)
+        bonds = sum(edge.get('order', 1) for edge in mol._adj[node_idx].values())
     else:
-        bonds = len(mol[node_idx])
+        bonds = len(mol._adj[node_idx])
+    if _cache is not None:
+        _cache[node_idx, use_order] = bonds
     return bonds
 
 
-def has_default_h_count(mol, node_idx, use_order=True):
+def has_default_h_count(mol, node_idx, use_order=True, _cache=None):
     """
     Returns whether the hydrogen count for this atom is non-standard.
 
@@ -494,31 +726,122 @@ def has_default_h_count(mol, node_idx, use_order=True):
         The node to look at. Should be in mol.
     use_order : bool
         If False, treat all bonds as single.
+    _cache : dict, optional
+        A cache of bond totals per node, see :func:`_bonds`.
 
     Returns
     -------
     bool
     """
-    bonds = _bonds(mol, node_idx, use_order)
-    val = valence(mol.nodes[node_idx])
+    node = mol.nodes[node_idx]
+    if (node.get('element') in _HALOGENS and node.get('charge', 0) == 0 and
+            node.get('hcount', 0) == 0 and len(mol._adj[node_idx]) == 1):
+        # An uncharged halogen with a single single bond is saturated; no
+        # need to compute its valence.
+        edge = next(iter(mol._adj[node_idx].values()))
+        if edge.get('order', 1) == 1:
+            return True
+    bonds = _bonds(mol, node_idx, use_order, _cache=_cache)
+    val = valence(node)
     val = [v for v in val if v >= bonds] or [0]
-    hcount = mol.nodes[node_idx].get('hcount', 0)
+    hcount = node.get('hcount', 0)
     return max(val[0] - bonds, 0) == hcount
 
 
-def _prune_nodes(nodes, mol):
+def _prune_nodes(nodes, mol, _cache=None):
     new_nodes = set()
     for node in nodes:
+        node_data = mol.nodes[node]
         # all wild card nodes are eligible
-        if mol.nodes[node].get('element', '*') == '*':
+        if node_data.get('element', '*') == '*':
             new_nodes.add(node)
             continue
-        missing = bonds_missing(mol, node, use_order=True)
+        missing = _missing_bonds(node_data, _bonds(mol, node, _cache=_cache))
         if missing > 0:
             new_nodes.add(node)
     return new_nodes
 
 
+def _perfect_matching(adjacency):
+    """
+    Tries to find a perfect matching for the graph described by `adjacency`
+    using simple combinatorics: first repeatedly match nodes with only one
+    neighbour left (those edges are forced), then extend the matching with
+    augmenting paths. This covers the alternating ring systems produced by
+    delocalized bonds in near-linear time, but cannot handle every graph:
+    whenever it comes up short it returns None, and the caller should fall
+    back to ``nx.max_weight_matching``.
+
+    Parameters
+    ----------
+    adjacency : dict
+        Mapping of nodes to an iterable of their neighbours.
+
+    Returns
+    -------
+    set[tuple] or None
+        The edges of a perfect matching, or None if this method can't find
+        one.
+    """
+    original = adjacency
+    adjacency = {node: set(neighbors) for node, neighbors in original.items()}
+    match = {}
+    # Forced edges: a node with a single remaining neighbour must match it.
+    leaves = deque(node for node, nbrs in adjacency.items() if len(nbrs) == 1)
+    while leaves:
+        node = leaves.popleft()
+        if node in match or len(adjacency[node]) != 1:
+            continue
+        neighbor = next(iter(adjacency[node]))
+        match[node] = neighbor
+        match[neighbor] = node
+        for matched in (node, neighbor):
+            for other in adjacency[matched]:
+                adjacency[other].discard(matched)
+                if len(adjacency[other]) == 1 and other not in match:
+                    leaves.append(other)
+            adjacency[matched] = set()
+    for node, nbrs in adjacency.items():
+        if node not in match and not nbrs:
+            # An unmatched node ran out of neighbours, so no perfect matching
+            # exists at all.
+            return None
+
+    def _augment(node, visited):
+        # Mark the node itself as well: the graph is not necessarily
+        # bipartite, so it could otherwise show up again as a neighbour
+        # further along the path, corrupting the matching.
+        visited.add(node)
+        for neighbor in adjacency[node]:
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            if neighbor not in match or _augment(match[neighbor], visited):
+                match[node] = neighbor
+                match[neighbor] = node
+                return True
+        return False
+
+    try:
+        for node in adjacency:
+            if node not in match and not _augment(node, set()):
+                return None
+    except RecursionError:  # pragma: no cover; only for huge ring systems
+        return None
+    # Double-check the result is a consistent perfect matching before
+    # trusting it; odd ring systems can defeat the simple augmenting search.
+    for node, neighbor in match.items():
+        if match.get(neighbor) != node or neighbor not in original[node]:
+            return None
+    if len(match) != len(adjacency):
+        return None
+    edges = set()
+    for node, neighbor in match.items():
+        if (neighbor, node) not in edges:
+            edges.add((node, neighbor))
+    return edges
+
+
 def correct_aromatic_rings(mol, strict=True, estimation_threshold=None, max_ring_size=None):
     """
     Aromaticity is defined here as regions that show delocalization induced
@@ -557,19 +880,31 @@ def correct_aromatic_rings(mol, strict=True, estimation_threshold=None, max_ring
     arom_atoms = {node for node, aromatic in mol.nodes(data='aromatic') if aromatic}
     stars = {node for node in mol if mol.nodes[node].get('element', '*') == '*'}
     nx.set_node_attributes(mol, False, 'aromatic')
-    for edge in mol.edges:
-        if mol.edges[edge].get('order') == 1.5:
-            mol.edges[edge]['order'] = 1
+    for _, _, edge_data in mol.edges(data=True):
+        if edge_data.get('order') == 1.5:
+            edge_data['order'] = 1
     # prune all nodes from molecule that are eligible and have
     # full valency
     ds_graph = _prune_nodes(arom_atoms|stars, mol)
 
-    sub_ds_graph = mol.subgraph(ds_graph).copy()
-    sub_ds_graph.remove_edges_from(e for e in sub_ds_graph.edges if sub_ds_graph.edges[e].get('order') == 0)
-    for u, v in sub_ds_graph.edges:
-        # Prefer not matching edges with *, especially *-* edges.
-        sub_ds_graph.edges[u, v]['w'] = 0.1**len({u, v} & stars)
-    max_match = nx.max_weight_matching(sub_ds_graph, weight='w')
+    # The matching only needs neighbour sets, so build a plain adjacency
+    # mapping restricted to the delocalized subgraph (minus zero-order bonds)
+    # rather than a networkx subgraph view with its filtered wrappers.
+    mol_adj = mol._adj
+    ds_adjacency = {node: {neighbor for neighbor, edge in mol_adj[node].items()
+                           if neighbor in ds_graph and edge.get('order') != 0}
+                    for node in ds_graph}
+    max_match = None
+    if not stars & ds_graph:
+        # Without wildcards all edges weigh the same, so try the specialized
+        # matcher before falling back to the general blossom algorithm.
+        max_match = _perfect_matching(ds_adjacency)
+    if max_match is None:
+        sub_ds_graph = nx.Graph(ds_adjacency)
+        for u, v in sub_ds_graph.edges:
+            # Prefer not matching edges with *, especially *-* edges.
+            sub_ds_graph.edges[u, v]['w'] = 0.1**len({u, v} & stars)
+        max_match = nx.max_weight_matching(sub_ds_graph, weight='w')
     # ... it breaks here to be exact, since wildcard atoms /may/ be aromatic,
     # the matching does not need to be perfect. Option: try to (somehow) have
     # the matching avoid wildcards (where possible), and then for all atoms in
@@ -580,7 +915,7 @@ def correct_aromatic_rings(mol, strict=True, estimation_threshold=None, max_ring
     # So... the smallest matching that perfectly matches at least the
     # non-wildcards?
     matched_nodes = {n for e in max_match for n in e}
-    unmatched_nodes = set(sub_ds_graph) - matched_nodes
+    unmatched_nodes = ds_graph - matched_nodes
     unmatched_nodes -= stars
 
     # we check if a maximum matching exists and
@@ -598,9 +933,9 @@ def correct_aromatic_rings(mol, strict=True, estimation_threshold=None, max_ring
     # Otherwise, c12ccccc1[nH]cc2 fails; you need to get rid of some nodes in
     # odd-numbered cycles (the N in this example), otherwise you can end up with
     # a suboptimal (but still maximal) matching
-    for edge in max_match:
-        if not set(edge) <= stars:
-            mol.edges[edge]['order'] = 2
+    for u, v in max_match:
+        if u not in stars or v not in stars:
+            mol_adj[u][v]['order'] = 2
 
     dekekulize(mol, estimation_threshold=estimation_threshold, max_ring_size=max_ring_size)
 
@@ -629,16 +964,19 @@ def kekulize(mol):
     arom_nodes = {n for n in mol if mol.nodes[n].get('aromatic') and mol.nodes[n].get('element', '*') in AROMATIC_ATOMS}
     aromatic_mol = mol.subgraph(arom_nodes).copy()
     aromatic_mol.remove_edges_from(e for e in aromatic_mol.edges if aromatic_mol.edges[e].get('order') == 0)
-    matching = nx.max_weight_matching(aromatic_mol)
-    if not nx.is_perfect_matching(aromatic_mol, matching):
-        raise ValueError('Aromatic region cannot be kekulized.')
+    matching = _perfect_matching(aromatic_mol._adj)
+    if matching is None:
+        matching = nx.max_weight_matching(aromatic_mol)
+        if not nx.is_perfect_matching(aromatic_mol, matching):
+            raise ValueError('Aromatic region cannot be kekulized.')
+    # Batch the updates so every edge and node attribute dict is touched once.
+    orders = {}
+    kekulized_nodes = set()
     for edge in aromatic_mol.edges:
-        if edge in matching or edge[::-1] in matching:
-            mol.edges[edge]['order'] = 2
-        else:
-            mol.edges[edge]['order'] = 1
-        mol.nodes[edge[0]]['aromatic'] = False
-        mol.nodes[edge[1]]['aromatic'] = False
+        orders[edge] = 2 if edge in matching or edge[::-1] in matching else 1
+        kekulized_nodes.update(edge)
+    nx.set_edge_attributes(mol, orders, 'order')
+    nx.set_node_attributes(mol, dict.fromkeys(kekulized_nodes, False), 'aromatic')
 
 
 def _reorder_cycle(graph, nodes):
@@ -770,6 +1108,10 @@ def dekekulize(mol, estimation_threshold=None, max_ring_size=None):
     # 2) For complex ring systems:
     #   3) if too large: fast approximation, this may make too many edges aromatic
     #   4) if small enough: enumerate all cycles.
+    # Aromaticity is detected on the submol copy, so the updates to mol can
+    # be collected across all ring systems and applied in one go at the end.
+    aromatic_nodes = set()
+    aromatic_edges = set()
     components = (submol.subgraph(nodes) for nodes in nx.biconnected_components(submol))
     for ring_system in components:
         is_simple = len(ring_system.nodes) == len(ring_system.edges)
@@ -792,13 +1134,15 @@ def dekekulize(mol, estimation_threshold=None, max_ring_size=None):
 
         for cycle in cycles:
             if all_aromatic or _ring_is_aromatic(submol, cycle):
-                for node in cycle:
-                    mol.nodes[node]['aromatic'] = True
+                aromatic_nodes.update(cycle)
                 for edge in zip(cycle, cycle[1:] + [cycle[0]]):
-                    mol.edges[edge]['order'] = 1.5
                     edges_found.add(frozenset(edge))
                 if edges_to_find and edges_to_find <= edges_found:
                     break
+        aromatic_edges.update(edges_found)
+    nx.set_node_attributes(mol, dict.fromkeys(aromatic_nodes, True), 'aromatic')
+    nx.set_edge_attributes(mol, dict.fromkeys(map(tuple, aromatic_edges), 1.5),
+                           'order')
 
 def increment_bond_orders(molecule, max_bond_order=3):
     """
@@ -813,29 +1157,36 @@ def increment_bond_orders(molecule, max_bond_order=3):
 
     Returns
     -------
-    None
-        molecule is modified in-place.
+    dict
+        The number of bonds each node is still missing after the bond orders
+        have been incremented, keyed by node. molecule is modified in-place.
     """
     # Gather the number of open spots for all atoms beforehand, since some
     # might have multiple oxidation states (e.g. S). We don't want to change
     # oxidation state halfway through for some funny reason. It shouldn't be
     # necessary, but it can't hurt.
     missing_bonds = {}
-    for idx in molecule:
-        missing_bonds[idx] = max(bonds_missing(molecule, idx), 0)
+    for idx, node in molecule.nodes(data=True):
+        missing_bonds[idx] = max(_missing_bonds(node, _bonds(molecule, idx)), 0)
 
+    adjacency = molecule._adj
     for idx, jdx in molecule.edges:
-        missing_idx = missing_bonds[idx]
-        missing_jdx = missing_bonds[jdx]
-        edge_missing = min(missing_idx, missing_jdx)
-        current_order = molecule.edges[idx, jdx].get("order", 1)
+        # For an undirected graph adjacency[idx][jdx] is the same dict as
+        # adjacency[jdx][idx], so one lookup serves both reading and writing.
+        edge = adjacency[idx][jdx]
+        current_order = edge.get("order", 1)
         if current_order == 1.5 or current_order >= max_bond_order:
             continue
+        edge_missing = min(missing_bonds[idx], missing_bonds[jdx])
         new_order = edge_missing + current_order
         new_order = min(new_order, max_bond_order)
-        molecule.edges[idx, jdx]['order'] = new_order
-        missing_bonds[idx] -= edge_missing
-        missing_bonds[jdx] -= edge_missing
+        edge['order'] = new_order
+        # Only charge the atoms for the increment actually made, which can be
+        # less than edge_missing when max_bond_order clamps the new order.
+        added = new_order - current_order
+        missing_bonds[idx] -= added
+        missing_bonds[jdx] -= added
+    return missing_bonds
 
 
 def _mark_chiral_atoms(molecule):